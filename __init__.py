@@ -6,12 +6,93 @@ FRC Stratometer.
 See the README for more information on writing the strat function.
 '''
 
+import copy
+import itertools
+import os
+from multiprocessing import Pool
+
 import numpy as np
-from numpy.random import normal, rand
 import matplotlib.pyplot as plt
 
+# The serial match engine's inner loop is also available as a Cython
+# extension (_stratometer.pyx); use it when built, else the pure-Python
+# loop defined below.
+try:
+    from ._stratometer import run_period as _run_period
+    from ._stratometer import run_period_notrace as _run_period_notrace
+except ImportError:
+    _run_period = None
+    _run_period_notrace = None
+
+# Scalar rolls are served from preallocated sample pools that are refilled
+# with a single vectorized generator call every _POOLSIZE draws. This keeps
+# per-action RNG cost to an array read instead of a full NumPy dispatch.
+_POOLSIZE = 4096
+_rng = np.random.default_rng()
+_normal_pool = _rng.standard_normal(_POOLSIZE)
+_uniform_pool = _rng.random(_POOLSIZE)
+_normal_i = 0
+_uniform_i = 0
+
+# Pre-bound generator methods for the vectorized roll paths: one
+# LOAD_FAST-able name instead of a lookup through the module dict, and
+# the PCG64 generator rather than the slower legacy numpy.random
+# MT19937 functions.
+_normal = _rng.normal
+_rand = _rng.random
+
+
+def set_seed(seed=None):
+    '''
+    Seed the module-level random generator and refill the sample pools,
+    e.g., for reproducible simulations.
 
-def roll_for_time(avg, stddev):
+    Parameters
+    ----------
+    seed : int, defaults to None
+        Seed passed to `numpy.random.default_rng`; None draws fresh entropy.
+    '''
+
+    global _rng, _normal, _rand
+    global _normal_pool, _uniform_pool, _normal_i, _uniform_i
+
+    _rng = np.random.default_rng(seed)
+    _normal = _rng.normal
+    _rand = _rng.random
+    _normal_pool = _rng.standard_normal(_POOLSIZE)
+    _uniform_pool = _rng.random(_POOLSIZE)
+    _normal_i = _uniform_i = 0
+
+
+def _next_normal():
+    '''Return one standard-normal sample from the pool, refilling as needed.'''
+
+    global _normal_i, _normal_pool
+
+    i = _normal_i
+    if i >= _POOLSIZE:
+        _normal_pool = _rng.standard_normal(_POOLSIZE)
+        i = 0
+    _normal_i = i + 1
+
+    return _normal_pool[i]
+
+
+def _next_uniform():
+    '''Return one uniform [0, 1) sample from the pool, refilling as needed.'''
+
+    global _uniform_i, _uniform_pool
+
+    i = _uniform_i
+    if i >= _POOLSIZE:
+        _uniform_pool = _rng.random(_POOLSIZE)
+        i = 0
+    _uniform_i = i + 1
+
+    return _uniform_pool[i]
+
+
+def roll_for_time(avg, stddev, size=None):
     '''
     Roll for time elapsed of some action by drawing from normal distribution
     to account for variability in performance.
@@ -21,17 +102,22 @@ def roll_for_time(avg, stddev):
     avg, stddev : float
         Set the mean and standard deviation for the distribution from which
         the function will draw.
+    size : int, defaults to None
+        If given, draw *size* independent rolls at once and return them as
+        an array (one roll per parallel trial).
 
     Returns
     -------
-    time : float
+    time : float or numpy array
         Time elapsed for the action.
     '''
 
-    return normal(avg, stddev)
+    if size is None:
+        return avg + stddev * _next_normal()
+    return _normal(avg, stddev, size)
 
 
-def roll_for_success(rate):
+def roll_for_success(rate, size=None):
     '''
     Determine if a function is successful or not given a *rate* of success.
 
@@ -39,14 +125,212 @@ def roll_for_success(rate):
     ----------
     rate : float, [0, 1]
         The fraction of success (e.g., .7 is 70% success rate).
+    size : int, defaults to None
+        If given, draw *size* independent rolls at once and return them as
+        a boolean array (one roll per parallel trial).
 
     Returns
     -------
-    outcome : bool
+    outcome : bool or numpy array
         Outcome of action, either True (success) or False.
     '''
 
-    return rate > rand()
+    if size is None:
+        return rate > _next_uniform()
+    return rate > _rand(size)
+
+
+def roll_for_success_mask(rate, ntrials=64):
+    '''
+    Determine success for up to 64 independent trials at once, packed
+    into the bits of one unsigned 64-bit integer (trial *i* sets bit
+    *i*). A state update over 64 trials then becomes a single bitwise
+    AND/OR instead of 64 per-trial branches, SWAR style:
+
+        ``has_coral |= roll_for_success_mask(rate) & active_mask``
+
+    Note that the boolean-array masks used by `VectorFrcMatch` remain
+    the general-purpose representation for arbitrary trial counts.
+
+    Parameters
+    ----------
+    rate : float, [0, 1]
+        The fraction of success (e.g., .7 is 70% success rate).
+    ntrials : int, defaults to 64
+        Number of trials to roll, between 1 and 64; bits above *ntrials*
+        are left clear.
+
+    Returns
+    -------
+    mask : numpy.uint64
+        Packed success bits, one per trial.
+    '''
+
+    if not 1 <= ntrials <= 64:
+        raise ValueError('ntrials must be between 1 and 64.')
+
+    # One vectorized draw for all 64 lanes, packed little-endian so that
+    # trial i lands in bit i:
+    draw = rate > _rand(64)
+    mask = np.packbits(draw, bitorder='little').view(np.uint64)[0]
+
+    if ntrials < 64:
+        mask &= np.uint64((1 << ntrials) - 1)
+
+    return mask
+
+
+def unpack_success_mask(mask, ntrials=64):
+    '''
+    Expand a packed success mask from `roll_for_success_mask` back into
+    a boolean array of *ntrials* outcomes.
+    '''
+
+    bits = np.frombuffer(np.uint64(mask).tobytes(), dtype=np.uint8)
+    return np.unpackbits(bits, bitorder='little')[:ntrials].astype(bool)
+
+
+def _run_period_py(strat, status, tstart, tstop, time_buf, score_buf, n):
+    '''
+    Advance the match clock from *tstart* until it passes *tstop*,
+    recording each completed action in the history buffers. Pure-Python
+    fallback for `_stratometer.run_period`; see that module for the full
+    contract.
+    '''
+
+    tnow = tstart
+    maxn = time_buf.shape[0]
+
+    # Carry the running totals in locals; the buffers just record them.
+    cur_time = time_buf[n - 1]
+    cur_score = score_buf[n - 1]
+
+    while tnow < tstop:
+        # Stop early if the history buffers are full; caller will grow
+        # them and resume.
+        if n >= maxn:
+            break
+
+        # Pick action based on game status:
+        action = strat(status)
+
+        # Perform action and get change in time, points:
+        dtime, dpoints = action(status)
+
+        # Clamp an action that overruns the period to the time remaining;
+        # it earns no points but the clock still reaches the boundary.
+        rem = tstop - tnow
+        over = dtime > rem
+        dtime = rem if over else dtime
+        dpoints = 0 if over else dpoints
+
+        # Update time and record the action:
+        tnow += dtime
+        cur_time += dtime
+        cur_score += dpoints
+        time_buf[n] = cur_time
+        score_buf[n] = cur_score
+        n += 1
+
+    return n, tnow
+
+
+def _run_period_notrace_py(strat, status, tstart, tstop):
+    '''
+    Like `_run_period_py` but without recording the per-action history:
+    only the points scored during the period are accumulated. Pure-Python
+    fallback for `_stratometer.run_period_notrace`.
+    '''
+
+    tnow = tstart
+    points = 0
+
+    while tnow < tstop:
+        # Pick action based on game status:
+        action = strat(status)
+
+        # Perform action and get change in time, points:
+        dtime, dpoints = action(status)
+
+        # Clamp an action that overruns the period to the time remaining;
+        # it earns no points but the clock still reaches the boundary.
+        rem = tstop - tnow
+        over = dtime > rem
+        dtime = rem if over else dtime
+        dpoints = 0 if over else dpoints
+
+        tnow += dtime
+        points += dpoints
+
+    return points
+
+
+if _run_period is None:
+    _run_period = _run_period_py
+    _run_period_notrace = _run_period_notrace_py
+
+
+def null_gamefunc(status):
+    '''Default game function: leave the game status unchanged.'''
+    pass
+
+
+def _run_one(args):
+    '''
+    Worker function for `FrcMatch.run_matches`: build and run one seeded
+    match, returning its period scores. Must be a top-level function so
+    it can be pickled into worker processes.
+    '''
+
+    strat, gamefunc, gametime, autontime, endgametime, seed = args
+
+    # Strategies are usually bound methods of a bot object whose state
+    # mutates over a match; deep-copy so every trial starts from a fresh
+    # bot even when several trials share one pickled copy.
+    strat = copy.deepcopy(strat)
+
+    # Give this match its own independent RNG stream:
+    set_seed(seed)
+
+    match = FrcMatch(strat, gametime=gametime, autontime=autontime,
+                     endgametime=endgametime, gamefunc=gamefunc)
+    match.run_game()
+
+    return match.points_auton, match.points_tele, match.points_end
+
+
+class GameStatus(object):
+    '''
+    Game status container passed to strategy and action functions.
+
+    This replaces the plain status dictionary used previously. Values are
+    stored in `__slots__` attributes, so hot-loop access compiles to a
+    fixed slot offset instead of a string hash plus dict probe. Item
+    access with the usual keys (``status['auton']``) still works so
+    existing strategy functions are unaffected, but attribute access
+    (``status.auton``) is faster and preferred.
+
+    Because of `__slots__`, game modules cannot invent new keys on the
+    fly; game-specific fields must be registered in the slot list below.
+    '''
+
+    __slots__ = ('time', 'auton', 'endgame', 'autontime', 'gametime',
+                 'endgametime', 'gameover', 'ntrials',
+                 'coral_l1', 'coral_l2', 'coral_l3', 'coral_l4',
+                 'coral_floor', 'coral_station')
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return hasattr(self, key)
 
 
 class FrcMatch(object):
@@ -55,7 +339,7 @@ class FrcMatch(object):
     '''
 
     def __init__(self, stratfunc, gametime=150, autontime=15,
-                 endgametime=130, gamefunc=lambda x: None):
+                 endgametime=130, gamefunc=None):
         '''
         Set up object.
 
@@ -77,7 +361,7 @@ class FrcMatch(object):
         '''
 
         # Stash game status modifier:
-        self.gamefunc = gamefunc
+        self.gamefunc = gamefunc if gamefunc is not None else null_gamefunc
 
         # Stash strategy:
         self.strat = stratfunc
@@ -86,8 +370,15 @@ class FrcMatch(object):
         self.gametime = gametime
         self.autontime, self.endgametime = autontime, endgametime
 
-        # Initialize tracking variables:
-        self.time, self.score = [0], [0]
+        # Initialize tracking variables. Histories are preallocated numpy
+        # buffers written via a cursor (self._n) instead of Python lists --
+        # the number of actions per match is bounded, so size the buffers
+        # generously and truncate via the time/score properties.
+        self._maxsteps = int(np.ceil(gametime / 0.5)) + 8
+        self._time = np.empty(self._maxsteps)
+        self._score = np.empty(self._maxsteps, dtype=np.int32)
+        self._time[0], self._score[0] = 0, 0
+        self._n = 1
 
         # Set broad scoring categories for TOTAL points:
         self.points_auton = 0
@@ -95,13 +386,64 @@ class FrcMatch(object):
         self.points_end = 0
 
         # Create game status.
-        self.status = {'time': 0, 'auton': True, 'endgame': False,
-                       'autontime': autontime, 'gametime': gametime,
-                       'endgametime': endgametime, 'gameover': False}
+        self.status = GameStatus(time=0, auton=True, endgame=False,
+                                 autontime=autontime, gametime=gametime,
+                                 endgametime=endgametime, gameover=False)
 
         # Update status to match game:
         self.gamefunc(self.status)
 
+    @property
+    def time(self):
+        '''Time history of each scoring action as a numpy array.'''
+        return self._time[:self._n]
+
+    @property
+    def score(self):
+        '''Cumulative score history of each action as a numpy array.'''
+        return self._score[:self._n]
+
+    def _record(self, dtime, dpoints):
+        '''
+        Append one action to the time/score history buffers, growing them
+        in the (rare) case a strategy takes more steps than expected.
+        '''
+
+        n = self._n
+        if n >= self._maxsteps:
+            self._grow()
+        self._time[n] = self._time[n - 1] + dtime
+        self._score[n] = self._score[n - 1] + dpoints
+        self._n = n + 1
+
+    def _grow(self):
+        '''Double the capacity of the time/score history buffers.'''
+
+        self._maxsteps *= 2
+        self._time = np.concatenate(
+            (self._time, np.empty_like(self._time)))
+        self._score = np.concatenate(
+            (self._score, np.empty_like(self._score)))
+
+    def _run_span(self, tstart, tstop):
+        '''
+        Advance the match clock from *tstart* to *tstop* using the
+        compiled period loop when built (see `_stratometer.pyx`), growing
+        the history buffers if they fill mid-period.
+        '''
+
+        # Hoist hot attributes to locals (LOAD_FAST beats LOAD_ATTR in
+        # the loop); buffers are re-read after _grow rebinds them.
+        strat, status = self.strat, self.status
+
+        tnow = tstart
+        while True:
+            self._n, tnow = _run_period(strat, status, tnow, tstop,
+                                        self._time, self._score, self._n)
+            if tnow >= tstop:
+                return
+            self._grow()
+
     def reset_field(self):
         '''
         Reset values for a new simulation, but keep "robot-specific" values
@@ -109,85 +451,160 @@ class FrcMatch(object):
         '''
 
         # Initialize tracking variables:
-        self.game, self.score = [0], [0]
+        self._time[0], self._score[0] = 0, 0
+        self._n = 1
 
         # Set broad scoring categories for TOTAL points:
         self.points_auton = 0
         self.points_tele = 0
         self.points_end = 0
 
-        # Create game status.
-        self.status = {'time': 0, 'auton': True, 'endgame': False,
-                       'gameover': False}
+        # Reset game status in place -- the GameStatus slots already
+        # exist, so a multi-match sweep allocates nothing per reset.
+        status = self.status
+        status.time = 0
+        status.auton = True
+        status.endgame = False
+        status.autontime = self.autontime
+        status.gametime = self.gametime
+        status.endgametime = self.endgametime
+        status.gameover = False
 
         # Update to game:
-        self.gamefunc(self.status)
+        self.gamefunc(status)
 
-    def run_game(self):
-        '''Run game and save scoring values.'''
+    def run_game(self, record_trace=False):
+        '''
+        Run game and save scoring values.
 
-        tnow = 0.0  # Set initial time.
+        Parameters
+        ----------
+        record_trace : bool, defaults to False
+            If True, record the per-action time/score history required by
+            `viz_game`. Monte Carlo sweeps that only need period totals
+            should leave this off: skipping the history writes removes
+            hundreds of buffer operations per match.
+        '''
 
-        # ##AUTONOMOUS PERIOD## #
-        while tnow < self.autontime:
-            # Pick action based on game status:
-            action = self.strat(self.status)
+        if record_trace:
+            # ##AUTONOMOUS PERIOD## #
+            self._run_span(0.0, self.autontime)
 
-            # Perform action and get change in time, points:
-            dtime, dpoints = action(self.status)
+            # Stash auton points:
+            self.points_auton = int(self._score[self._n - 1])
 
-            # Update time:
-            tnow += dtime
+            # Update status; game clock restarts at end of auton.
+            self.status.auton = False
 
-            # Score points if we did it before end of auton period.
-            if tnow < self.autontime:
-                self.score.append(self.score[-1] + dpoints)
-                self.time.append(self.time[-1] + dtime)
+            # ## TELEOP PERIOD ## #
+            self._run_span(self.autontime, self.gametime)
 
-        # Stash auton points:
-        self.points_auton = self.score[-1]
+            # Stash teleop points.
+            self.points_tele = (int(self._score[self._n - 1])
+                                - self.points_auton)
 
-        # After auton, hard-set game clock:
-        tnow = self.autontime
+            # ### END GAME ### #
+            # Set endgame status values (tbd.)
+            self._record(0, 0)
+        else:
+            # Same periods, but only period totals are accumulated:
+            self.points_auton = int(_run_period_notrace(
+                self.strat, self.status, 0.0, self.autontime))
+            self.status.auton = False
+            self.points_tele = int(_run_period_notrace(
+                self.strat, self.status, self.autontime, self.gametime))
 
-        # Update status.
-        self.status['auton'] = False
+        # End game.
+        self.status.gameover = True
 
-        # ## TELEOP PERIOD ## #
-        while tnow < self.gametime:
-            # Pick action based on game status:
-            action = self.strat(self.status)
+    def run_game_with_trace(self):
+        '''
+        Run game recording the full per-action time/score history so the
+        match can be visualized with `viz_game`.
+        '''
 
-            # Perform action and get change in time, points:
-            dtime, dpoints = action(self.status)
+        self.run_game(record_trace=True)
 
-            # Update time:
-            tnow += dtime
+    def run_games(self, ntrials):
+        '''
+        Run *ntrials* independent matches at once using the vectorized
+        engine (see :class:`VectorFrcMatch`) and return the resulting
+        match object.
 
-            # Score points if we did it before end of auton period.
-            if tnow < self.gametime:
-                self.score.append(self.score[-1] + dpoints)
-                self.time.append(self.time[-1] + dtime)
+        Note that the strategy function must accept boolean trial masks,
+        which is not the case for strategies written for the serial engine.
 
-        # Stash teleop points.
-        self.points_tele = self.score[-1] - self.points_auton
+        Parameters
+        ----------
+        ntrials : int
+            Number of independent matches to simulate.
+
+        Returns
+        -------
+        vmatch : VectorFrcMatch
+            The completed vectorized match object holding per-trial scores.
+        '''
 
-        # ### END GAME ### #
-        # Set endgame status values (tbd.)
-        self.score.append(self.score[-1])
-        self.time.append(self.time[-1])
+        vmatch = VectorFrcMatch(self.strat, ntrials, gametime=self.gametime,
+                                autontime=self.autontime,
+                                endgametime=self.endgametime,
+                                gamefunc=self.gamefunc)
+        vmatch.run_game()
 
-        # End game.
-        self.status['gameover'] = True
+        return vmatch
+
+    def run_matches(self, ntrials, workers=None):
+        '''
+        Run *ntrials* independent matches in parallel worker processes.
+
+        Matches are fully independent, so this sidesteps the GIL with
+        `multiprocessing.Pool` and scales with core count. Each worker
+        match is seeded from its own spawned seed sequence, so trials are
+        statistically independent and the sweep is safe to parallelize.
+
+        Parameters
+        ----------
+        ntrials : int
+            Number of independent matches to simulate.
+        workers : int, defaults to None
+            Number of worker processes; None uses the CPU count.
+
+        Returns
+        -------
+        points : numpy array of shape (ntrials, 3)
+            Autonomous, teleop, and endgame points for each match, in
+            completion order.
+        '''
+
+        if workers is None:
+            workers = os.cpu_count()
+
+        # Independent RNG streams for every match:
+        seeds = np.random.SeedSequence().spawn(ntrials)
+
+        args = zip(itertools.repeat(self.strat),
+                   itertools.repeat(self.gamefunc),
+                   itertools.repeat(self.gametime),
+                   itertools.repeat(self.autontime),
+                   itertools.repeat(self.endgametime), seeds)
+
+        with Pool(workers) as pool:
+            results = list(pool.imap_unordered(_run_one, args, chunksize=64))
+
+        return np.array(results)
 
     def viz_game(self, title='FRC Stratometer Match Simulation'):
         '''
         Create single-game visualizations.
         '''
 
-        if not self.status['gameover']:
+        if not self.status.gameover:
             raise ValueError('Simulation not complete.')
 
+        if self._n < 2:
+            raise ValueError('No history recorded; use '
+                             'run_game_with_trace() to visualize a match.')
+
         # ### Figure 1:
         fig1, ax = plt.subplots(1, 1, figsize=[8, 6])
         ax.plot(self.time, self.score, 'o-', drawstyle='steps-post')
@@ -216,4 +633,206 @@ class FrcMatch(object):
         ax.set_title(title)
         fig2.tight_layout()
 
-        return fig1, fig2
\ No newline at end of file
+        return fig1, fig2
+
+
+class MatchPool(object):
+    '''
+    Reuse a single :class:`FrcMatch` across many Monte Carlo trials.
+
+    Building a fresh match per trial allocates a status object, history
+    buffers, and tracking attributes every time; on sweeps of many
+    thousands of trials that allocation and the garbage it leaves behind
+    dominate. The pool builds one match up front and resets it in place
+    between trials (see `FrcMatch.reset_field`), so the per-trial hot
+    path allocates essentially nothing.
+
+    Strategy functions are usually bound methods of a bot object whose
+    state mutates over a match; pass *resetfunc* to restore that state
+    between trials (e.g., ``bot.reset`` for the reefscape demo bot).
+    '''
+
+    def __init__(self, stratfunc, gametime=150, autontime=15,
+                 endgametime=130, gamefunc=None, resetfunc=None):
+        '''
+        Set up object. Match parameters are as for :class:`FrcMatch`.
+
+        Parameters
+        ----------
+        resetfunc : function, defaults to None
+            If given, called with no arguments before every trial to
+            restore strategy/bot state for a new match.
+        '''
+
+        self.match = FrcMatch(stratfunc, gametime=gametime,
+                              autontime=autontime,
+                              endgametime=endgametime, gamefunc=gamefunc)
+        self.resetfunc = resetfunc
+
+    def run(self):
+        '''
+        Run one match on the pooled object.
+
+        Returns
+        -------
+        points_auton, points_tele, points_end : int
+            Points scored in each period of the match.
+        '''
+
+        match = self.match
+        match.reset_field()
+
+        if self.resetfunc is not None:
+            self.resetfunc()
+
+        match.run_game()
+
+        return match.points_auton, match.points_tele, match.points_end
+
+    def run_all(self, ntrials):
+        '''
+        Run *ntrials* matches on the pooled object.
+
+        Parameters
+        ----------
+        ntrials : int
+            Number of independent matches to simulate.
+
+        Returns
+        -------
+        points : numpy array of shape (ntrials, 3)
+            Autonomous, teleop, and endgame points for each match.
+        '''
+
+        points = np.empty((ntrials, 3), dtype=np.int32)
+        for i in range(ntrials):
+            points[i] = self.run()
+
+        return points
+
+
+class VectorFrcMatch(object):
+    '''
+    Match object for simulating many independent matches simultaneously.
+
+    Where :class:`FrcMatch` steps a single game state through the match,
+    this class carries *ntrials* parallel trial states as NumPy arrays
+    (time, score, and any game-specific counters) and advances all of them
+    together on each action. Per-trial branching is expressed with boolean
+    masks instead of `if` statements, so the cost of the Python interpreter
+    loop is shared across every trial. For Monte Carlo strategy evaluation
+    this is dramatically faster than calling `FrcMatch.run_game` in a loop.
+
+    Strategy and action functions for this engine take an extra boolean
+    *active* array marking which trials still have time remaining, and must
+    return per-trial `dtime`/`dpoints` arrays (see `roll_for_time` and
+    `roll_for_success` with the *size* keyword).
+    '''
+
+    def __init__(self, stratfunc, ntrials, gametime=150, autontime=15,
+                 endgametime=130, gamefunc=None):
+        '''
+        Set up object.
+
+        Parameters
+        ----------
+        stratfunc : function object
+            A function that sets what action will be taken by the robots.
+            It must take the status dictionary and the boolean *active*
+            trial mask and return a vectorized action function.
+        ntrials : int
+            The number of independent trials to carry in parallel.
+        gametime : float, defaults to 150
+            Set the total game time in seconds.
+        autontime : float, defaults to 30
+            Set the autonomous period in seconds.
+        endgametime : float, defaults to 120
+            Set the time, in seconds, where endgame begins.
+        gamefunc : function, defaults to Null
+            Create a function to set the status dictionary to match the game
+            type. Game counters should be set as ntrials-sized arrays.
+        '''
+
+        # Stash game status modifier:
+        self.gamefunc = gamefunc if gamefunc is not None else null_gamefunc
+
+        # Stash strategy:
+        self.strat = stratfunc
+
+        # Stash critical values as object attributes:
+        self.ntrials = ntrials
+        self.gametime = gametime
+        self.autontime, self.endgametime = autontime, endgametime
+
+        # Initialize per-trial tracking arrays. The running score and the
+        # broad per-period totals share one contiguous int32 block; the
+        # named attributes are row views into it.
+        self.tnow = np.zeros(ntrials)
+        self._scores = np.zeros((4, ntrials), dtype=np.int32)
+        (self.score, self.points_auton, self.points_tele,
+         self.points_end) = self._scores
+
+        # Create game status. Period flags are shared by all trials since
+        # periods are advanced in lock step; counters are per-trial arrays.
+        self.status = GameStatus(time=self.tnow, auton=True, endgame=False,
+                                 autontime=autontime, gametime=gametime,
+                                 endgametime=endgametime, gameover=False,
+                                 ntrials=ntrials)
+
+        # Update status to match game:
+        self.gamefunc(self.status)
+
+    def _run_period(self, tstop):
+        '''
+        Advance all trials until every trial clock reaches *tstop*, masking
+        out trials that finish early.
+        '''
+
+        # Hoist hot attributes to locals for the loop:
+        tnow, score = self.tnow, self.score
+        strat, status = self.strat, self.status
+
+        while np.any(tnow < tstop):
+            # Mask of trials that still have time on the clock:
+            active = tnow < tstop
+
+            # Pick action based on game status:
+            action = strat(status, active)
+
+            # Perform action and get per-trial change in time, points:
+            dtime, dpoints = action(status, active)
+
+            # Clamp trials whose action overruns the period: they take
+            # the remaining time and earn no points.
+            rem = tstop - tnow
+            over = dtime > rem
+            dtime = np.where(over, rem, dtime)
+            dpoints = np.where(over, 0, dpoints)
+
+            # Update time and score for active trials only:
+            tnow += np.where(active, dtime, 0.0)
+            score += np.where(active, dpoints, 0)
+
+    def run_game(self):
+        '''Run all trials to completion and save scoring values.'''
+
+        # ##AUTONOMOUS PERIOD## #
+        self._run_period(self.autontime)
+
+        # Stash auton points:
+        self.points_auton[:] = self.score
+
+        # After auton, hard-set game clock:
+        self.tnow[:] = self.autontime
+
+        # Update status.
+        self.status.auton = False
+
+        # ## TELEOP PERIOD ## #
+        self._run_period(self.gametime)
+
+        # Stash teleop points.
+        self.points_tele[:] = self.score - self.points_auton
+
+        # End game.
+        self.status.gameover = True
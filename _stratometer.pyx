@@ -0,0 +1,121 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+
+'''
+Compiled hot loop for the FRC Stratometer serial match engine.
+
+This module holds the per-period simulation loop of `FrcMatch.run_game`
+with typed locals, so the time/score accumulation runs at C speed while
+strategy and action callbacks remain ordinary Python objects. It is built
+as an optional extension; `FRCstratometer` falls back to an equivalent
+pure-Python loop when the compiled module is unavailable.
+'''
+
+
+def run_period(object strat, object status, double tstart, double tstop,
+               double[::1] time_buf, int[::1] score_buf, Py_ssize_t n):
+    '''
+    Advance the match clock from *tstart* until it passes *tstop*,
+    recording each completed action in the history buffers.
+
+    Returns the updated buffer cursor and the final clock value. If the
+    buffers fill before the period ends, the loop returns early with the
+    clock still short of *tstop* so the caller can grow the buffers and
+    resume.
+
+    Parameters
+    ----------
+    strat : function object
+        Strategy function; called with *status*, returns an action.
+    status : GameStatus
+        Game status object passed to strategy and actions.
+    tstart, tstop : float
+        Start of the period and the game clock value that ends it.
+    time_buf, score_buf : numpy arrays (float64, int32)
+        Preallocated history buffers written via the cursor *n*.
+    n : int
+        History buffer cursor on entry.
+
+    Returns
+    -------
+    n : int
+        Updated history buffer cursor.
+    tnow : float
+        Game clock after the loop; >= *tstop* unless the buffers filled.
+    '''
+
+    cdef double tnow = tstart
+    cdef double dtime, rem
+    cdef int dpoints
+    cdef bint over
+    cdef Py_ssize_t maxn = time_buf.shape[0]
+
+    # Carry the running totals in typed locals; the buffers just record
+    # them.
+    cdef double cur_time = time_buf[n - 1]
+    cdef int cur_score = score_buf[n - 1]
+
+    while tnow < tstop:
+        # Stop early if the history buffers are full; caller will grow
+        # them and resume.
+        if n >= maxn:
+            break
+
+        # Pick action based on game status:
+        action = strat(status)
+
+        # Perform action and get change in time, points:
+        dtime, dpoints = action(status)
+
+        # Clamp an action that overruns the period to the time remaining;
+        # it earns no points but the clock still reaches the boundary.
+        rem = tstop - tnow
+        over = dtime > rem
+        dtime = rem if over else dtime
+        dpoints = 0 if over else dpoints
+
+        # Update time and record the action:
+        tnow += dtime
+        cur_time += dtime
+        cur_score += dpoints
+        time_buf[n] = cur_time
+        score_buf[n] = cur_score
+        n += 1
+
+    return n, tnow
+
+
+def run_period_notrace(object strat, object status, double tstart,
+                       double tstop):
+    '''
+    Like `run_period` but without recording the per-action history: only
+    the points scored during the period are accumulated. Used for Monte
+    Carlo sweeps where the visualization trace is pure overhead.
+
+    Returns the points scored during the period.
+    '''
+
+    cdef double tnow = tstart
+    cdef double dtime, rem
+    cdef int dpoints
+    cdef int points = 0
+
+    while tnow < tstop:
+        # Pick action based on game status:
+        action = strat(status)
+
+        # Perform action and get change in time, points:
+        dtime, dpoints = action(status)
+
+        # Clamp an action that overruns the period to the time remaining;
+        # it earns no points but the clock still reaches the boundary.
+        rem = tstop - tnow
+        if dtime > rem:
+            dtime = rem
+            dpoints = 0
+
+        tnow += dtime
+        points += dpoints
+
+    return points
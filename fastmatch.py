@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+
+'''
+Numba-accelerated match engine for large Monte Carlo sweeps.
+
+The standard :class:`FRCstratometer.FrcMatch` loop is pure Python: every
+action is a dict lookup plus two function calls, which dominates run time
+when simulating thousands of matches. This module provides an alternative
+engine whose inner loop is compiled with Numba. To make that possible the
+game state lives in a flat numpy array (indexed by the `IDX_*` constants
+below) and actions are selected by integer ID (the `ACT_*` constants)
+instead of returning function objects. Strategy and step functions must
+therefore be `@njit`-compiled functions of the state array.
+
+This module requires the optional dependency **numba**; the rest of the
+package works without it.
+
+A compiled port of the reefscape "simple coral" demo strategy is included
+so the engine is usable out of the box.
+'''
+
+import numpy as np
+
+try:
+    from numba import cfunc, njit, prange, types
+except ImportError:
+    raise ImportError('FRCstratometer.fastmatch requires the optional '
+                      'dependency "numba".')
+
+# Typed signatures for compiled strategy and step callbacks. The engine
+# drivers below declare their callback arguments with these function
+# types, so callbacks are invoked through raw typed function pointers --
+# no PyObject call, no argument boxing -- and the drivers compile once
+# instead of respecializing per strategy.
+STRAT_SIG = types.int64(types.float64[::1])
+STEP_SIG = types.Tuple((types.float64, types.int64))(
+    types.float64[::1], types.int64)
+_STRAT_FTYPE = types.FunctionType(STRAT_SIG)
+_STEP_FTYPE = types.FunctionType(STEP_SIG)
+
+
+def compile_strategy(pyfunc):
+    '''
+    Ahead-of-time compile *pyfunc* as a strategy callback with the typed
+    `STRAT_SIG` signature via `numba.cfunc`. The function must take the
+    state array and return an integer action ID.
+    '''
+
+    return cfunc(STRAT_SIG, nopython=True)(pyfunc)
+
+
+def compile_step(pyfunc):
+    '''
+    Ahead-of-time compile *pyfunc* as a step callback with the typed
+    `STEP_SIG` signature via `numba.cfunc`. The function must take the
+    state array and an action ID and return the change in time and
+    points.
+    '''
+
+    return cfunc(STEP_SIG, nopython=True)(pyfunc)
+
+
+# Indexes into the flat game-state array. Core match flags come first,
+# reefscape-style game counters follow.
+IDX_AUTON = 0
+IDX_ENDGAME = 1
+IDX_GAMEOVER = 2
+IDX_HAS_CORAL = 3
+IDX_HAS_ALGAE = 4
+IDX_AUTON_DONE = 5
+IDX_CORAL_L1 = 6
+IDX_CORAL_L2 = 7
+IDX_CORAL_L3 = 8
+IDX_CORAL_L4 = 9
+IDX_CORAL_FLOOR = 10
+IDX_CORAL_STATION = 11
+NFIELDS = 12
+
+# Integer action IDs returned by compiled strategy functions:
+ACT_SLEEP = 0
+ACT_GET_CORAL = 1
+ACT_PLACE_CORAL = 2
+ACT_AUTON = 3
+
+
+@njit(cache=True)
+def reefscape_step(state, action_id):
+    '''
+    Perform the action given by *action_id* on *state*, mirroring the
+    actions of `reefscape.FrcBot`. Returns change in time and points.
+    '''
+
+    if action_id == ACT_AUTON:
+        # Simple deliver-the-coral auton (see FrcBot.simple_auton):
+        if state[IDX_AUTON_DONE] > 0:
+            return 15.0, 0
+        if state[IDX_HAS_CORAL] > 0:
+            state[IDX_CORAL_L1] += 1
+            state[IDX_HAS_CORAL] = 0
+        state[IDX_AUTON_DONE] = 1
+        return 10.0, 3 + 3
+
+    elif action_id == ACT_GET_CORAL:
+        # Move and obtain one coral (see FrcBot.get_coral):
+        if state[IDX_HAS_CORAL] > 0:
+            return 0.0, 0
+        if np.random.rand() < .9:
+            state[IDX_HAS_CORAL] = 1
+        return np.random.normal(10.0, 5.0), 0
+
+    elif action_id == ACT_PLACE_CORAL:
+        # Deliver coral to L1, always "lose" the coral:
+        if state[IDX_HAS_CORAL] == 0:
+            return 0.0, 0
+        state[IDX_HAS_CORAL] = 0
+        if np.random.rand() < .75:
+            return np.random.normal(5.0, 2.5), 2
+        return np.random.normal(5.0, 2.5), 0
+
+    # Default: sleep (do nothing) for 60 seconds.
+    return 60.0, 0
+
+
+@njit(cache=True)
+def simple_coral_strat(state):
+    '''
+    Compiled port of `FrcBot.simple_coral_strat`: run auton, then cycle
+    between obtaining and placing coral. Returns an action ID.
+    '''
+
+    if state[IDX_AUTON] > 0:
+        return ACT_AUTON
+    if state[IDX_HAS_CORAL] > 0:
+        return ACT_PLACE_CORAL
+    return ACT_GET_CORAL
+
+
+@njit(types.int64(_STRAT_FTYPE, _STEP_FTYPE, types.float64[::1],
+                  types.float64, types.float64))
+def _run_period(stratfunc, stepfunc, state, tstart, tstop):
+    '''
+    Advance one trial from *tstart* until its clock passes *tstop*,
+    returning the points scored during the period. The callbacks are
+    typed function pointers (see `STRAT_SIG`/`STEP_SIG`); both plain
+    `@njit` functions and `compile_strategy`/`compile_step` cfuncs are
+    accepted.
+    '''
+
+    tnow = tstart
+    points = 0
+
+    while tnow < tstop:
+        action_id = stratfunc(state)
+        dtime, dpoints = stepfunc(state, action_id)
+
+        # Clamp an action that overruns the period to the time remaining;
+        # it earns no points but the clock still reaches the boundary.
+        rem = tstop - tnow
+        if dtime > rem:
+            dtime = rem
+            dpoints = 0
+
+        tnow += dtime
+        points += dpoints
+
+    return points
+
+
+@njit(parallel=True)
+def _run_games(stratfunc, stepfunc, states, autontime, gametime):
+    '''
+    Run every trial in *states* through a full match, in parallel across
+    threads. Returns per-trial auton and teleop points.
+    '''
+
+    ntrials = states.shape[0]
+    points_auton = np.empty(ntrials, dtype=np.int64)
+    points_tele = np.empty(ntrials, dtype=np.int64)
+
+    for i in prange(ntrials):
+        state = states[i]
+        points_auton[i] = _run_period(stratfunc, stepfunc, state,
+                                      0.0, autontime)
+        state[IDX_AUTON] = 0
+        points_tele[i] = _run_period(stratfunc, stepfunc, state,
+                                     autontime, gametime)
+        state[IDX_GAMEOVER] = 1
+
+    return points_auton, points_tele
+
+
+def init_reefscape_state(states, nloaded_coral=3):
+    '''
+    Initialize trial state rows to the reefscape game defaults, mirroring
+    `reefscape.init_game_status`.
+
+    Parameters
+    ----------
+    states : numpy array of shape (ntrials, NFIELDS)
+        Trial state rows created by `JitFrcMatch`.
+    nloaded_coral : int, defaults to 3
+        Set the number of pre-loaded coral on the alliance bots.
+    '''
+
+    states[:, IDX_AUTON] = 1
+    states[:, IDX_HAS_CORAL] = 1
+    states[:, IDX_CORAL_FLOOR] = 3
+    states[:, IDX_CORAL_STATION] = 60 - nloaded_coral
+
+
+class JitFrcMatch(object):
+    '''
+    Match object whose inner loop is Numba-compiled, for running very
+    large numbers of trials. The first call triggers JIT compilation, so
+    this engine only pays off for sweeps of many matches.
+    '''
+
+    def __init__(self, stratfunc=simple_coral_strat,
+                 stepfunc=reefscape_step, gametime=150, autontime=15,
+                 endgametime=130, initfunc=init_reefscape_state):
+        '''
+        Set up object.
+
+        Parameters
+        ----------
+        stratfunc : numba-compiled function, defaults to simple_coral_strat
+            An `@njit` function or `compile_strategy` cfunc taking the
+            state array and returning an integer action ID.
+        stepfunc : numba-compiled function, defaults to reefscape_step
+            An `@njit` function or `compile_step` cfunc taking the state
+            array and an action ID and returning the change in time and
+            points.
+        gametime : float, defaults to 150
+            Set the total game time in seconds.
+        autontime : float, defaults to 15
+            Set the autonomous period in seconds.
+        endgametime : float, defaults to 130
+            Set the time, in seconds, where endgame begins.
+        initfunc : function, defaults to init_reefscape_state
+            A function to set initial trial state rows to match the game.
+        '''
+
+        self.strat = stratfunc
+        self.step = stepfunc
+        self.initfunc = initfunc
+
+        self.gametime = gametime
+        self.autontime, self.endgametime = autontime, endgametime
+
+        # Per-trial scoring results, filled by run_games:
+        self.points_auton = None
+        self.points_tele = None
+
+    def run_games(self, ntrials):
+        '''
+        Run *ntrials* matches through the compiled engine, parallelized
+        across CPU threads.
+
+        Parameters
+        ----------
+        ntrials : int
+            Number of independent matches to simulate.
+
+        Returns
+        -------
+        points_auton, points_tele : numpy arrays
+            Per-trial points scored in the autonomous and teleop periods.
+        '''
+
+        states = np.zeros((ntrials, NFIELDS))
+        self.initfunc(states)
+
+        self.points_auton, self.points_tele = _run_games(
+            self.strat, self.step, states, float(self.autontime),
+            float(self.gametime))
+
+        return self.points_auton, self.points_tele
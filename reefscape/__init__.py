@@ -7,6 +7,11 @@ Reefscape: 2025 FRC Season
 import numpy as np
 from FRCstratometer import roll_for_time, roll_for_success
 
+# Row order of the per-trial counters inside the fused status block
+# allocated by init_game_status_batch:
+BATCH_STATUS_FIELDS = ('coral_l1', 'coral_l2', 'coral_l3', 'coral_l4',
+                       'coral_floor', 'coral_station')
+
 
 def init_game_status(status, nloaded_coral=3):
     '''
@@ -14,19 +19,47 @@ def init_game_status(status, nloaded_coral=3):
 
     Parameters
     ----------
-    status : dictionary
-        Status dict created by game object.
+    status : FRCstratometer.GameStatus
+        Status object created by game object.
     nloaded_coral : int, defaults to 3
         Set the number of pre-loaded coral on the alliance bots.
     '''
 
     # Initialize coral on reef:
-    status['coral_l1'] = 0
-    status['coral_l2'] = 0
-    status['coral_l3'] = 0
-    status['coral_l4'] = 0
-    status['coral_floor'] = 3
-    status['coral_station'] = 60 - nloaded_coral
+    status.coral_l1 = 0
+    status.coral_l2 = 0
+    status.coral_l3 = 0
+    status.coral_l4 = 0
+    status.coral_floor = 3
+    status.coral_station = 60 - nloaded_coral
+
+
+def init_game_status_batch(status, nloaded_coral=3):
+    '''
+    Initialize a vectorized game status (see `VectorFrcMatch`) to include
+    Reefscape elements, with one counter entry per trial.
+
+    Parameters
+    ----------
+    status : FRCstratometer.GameStatus
+        Status object created by the vectorized game object; must hold the
+        trial count in its 'ntrials' field.
+    nloaded_coral : int, defaults to 3
+        Set the number of pre-loaded coral on the alliance bots.
+    '''
+
+    ntrials = status.ntrials
+
+    # Initialize coral on reef, per trial. All counters live in one
+    # contiguous int32 block (one row per field, see BATCH_STATUS_FIELDS)
+    # and the named status fields are row views into it, so vectorized
+    # updates stream through a single prefetcher-friendly allocation.
+    state = np.zeros((len(BATCH_STATUS_FIELDS), ntrials), dtype=np.int32)
+    for row, field in zip(state, BATCH_STATUS_FIELDS):
+        setattr(status, field, row)
+
+    status.coral_floor[:] = 3
+    status.coral_station[:] = 60 - nloaded_coral
 
 
 class FrcBot(object):
@@ -42,6 +75,16 @@ class FrcBot(object):
         # Did we complete our autonomous?
         self.auton_complete = False
 
+    def reset(self):
+        '''
+        Reset bot state for a new match, e.g., between pooled Monte
+        Carlo trials (see `FRCstratometer.MatchPool`).
+        '''
+
+        self.has_coral = True
+        self.has_algae = False
+        self.auton_complete = False
+
     def get_coral(self, status, avgtime=10, stddev=5.0, success_rate=.9):
         '''Move and obtain one coral.'''
         if self.has_coral:
@@ -84,7 +127,7 @@ class FrcBot(object):
 
         # Deliver 1 coral to L1.
         if self.has_coral:
-            status['coral_l1'] += 1
+            status.coral_l1 += 1
             self.has_coral = False
 
         # Auton is complete!
@@ -99,7 +142,7 @@ class FrcBot(object):
         '''
 
         # Auton:
-        if status['auton']:
+        if status.auton:
             return self.simple_auton
 
         # Tele:
@@ -109,3 +152,116 @@ class FrcBot(object):
             return self.get_coral
 
 
+class FrcBotBatch(object):
+    '''
+    Vectorized counterpart of :class:`FrcBot` carrying *ntrials*
+    independent bots at once for use with `VectorFrcMatch`.
+
+    Bot state is stored structure-of-arrays style: one boolean numpy array
+    per flag, one entry per trial. Actions take the game status and the
+    boolean *active* trial mask and return per-trial time and point
+    arrays; all per-bot branching is expressed with masks.
+    '''
+
+    def __init__(self, ntrials):
+        self.ntrials = ntrials
+
+        # All bot flags share one contiguous boolean block; the named
+        # attributes are row views into it:
+        self._flags = np.zeros((3, ntrials), dtype=bool)
+        self.has_coral, self.has_algae, self.auton_complete = self._flags
+
+        # Bots start the match holding a coral:
+        self.has_coral[:] = True
+
+    def get_coral(self, status, active, avgtime=10, stddev=5.0,
+                  success_rate=.9):
+        '''Move and obtain one coral in every active bot lacking one.'''
+
+        # Bots that are active and do not already hold coral:
+        need = active & ~self.has_coral
+
+        # Roll success for all trials at once:
+        self.has_coral |= need & roll_for_success(success_rate, self.ntrials)
+
+        dtime = np.where(need, roll_for_time(avgtime, stddev, self.ntrials),
+                         0.0)
+        return dtime, np.zeros(self.ntrials, dtype=np.int32)
+
+    def place_coral(self, status, active, avgtime=5, stddev=2.5,
+                    succrate=.75):
+        '''Deliver coral to L1 in every active bot. Always "lose" the
+        coral.'''
+
+        # Bots that are active and hold coral:
+        placing = active & self.has_coral
+
+        # Drop coral:
+        self.has_coral &= ~placing
+
+        # Place coral with success rate:
+        dtime = np.where(placing,
+                         roll_for_time(avgtime, stddev, self.ntrials), 0.0)
+        dpoints = np.where(placing & roll_for_success(succrate,
+                                                      self.ntrials), 2, 0)
+        return dtime, dpoints
+
+    def sleep(self, status, active, sleeptime=60):
+        '''
+        Sleep (do nothing) for sleeptime seconds in every active bot.
+        '''
+
+        return np.where(active, float(sleeptime), 0.0), \
+            np.zeros(self.ntrials, dtype=np.int32)
+
+    def simple_auton(self, status, active, duration=10):
+        '''
+        Simple deliver-the-coral type auton across all active bots.
+        Returns per-trial time taken and points obtained.
+        '''
+
+        # Bots that have not yet run their auton:
+        fresh = active & ~self.auton_complete
+
+        # Deliver 1 coral to L1 where held:
+        delivered = fresh & self.has_coral
+        status.coral_l1 += delivered
+        self.has_coral &= ~delivered
+
+        # Auton is complete!
+        self.auton_complete |= fresh
+
+        # Branchless arithmetic update (fresh acts as a 0/1 lane mask):
+        # fresh bots take *duration* and score 6 (1 L1 delivery and
+        # leave); bots that already finished idle for 15 seconds.
+        dtime = 15.0 - (15.0 - duration) * fresh
+        dpoints = (3 + 3) * fresh
+        return dtime, dpoints
+
+    def cycle_coral(self, status, active):
+        '''
+        One teleop coral cycle: bots holding coral place it, the rest
+        go obtain one.
+        '''
+
+        placing = active & self.has_coral
+        getting = active & ~self.has_coral
+
+        dtime_p, dpoints_p = self.place_coral(status, placing)
+        dtime_g, dpoints_g = self.get_coral(status, getting)
+
+        return dtime_p + dtime_g, dpoints_p + dpoints_g
+
+    def simple_coral_strat(self, status, active):
+        '''
+        A strategy that focuses solely on obtaining and delivering coral.
+        '''
+
+        # Auton:
+        if status.auton:
+            return self.simple_auton
+
+        # Tele:
+        return self.cycle_coral
+
+
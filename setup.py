@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+'''
+Installation script for FRCstratometer.
+
+The repository root is the package itself, so the package directory is
+mapped to '.'. When Cython is available, the hot simulation loop in
+_stratometer.pyx is compiled as an extension module and picked up
+automatically by the package; without Cython the install still works
+and the package falls back to the pure-Python loop.
+'''
+
+from setuptools import Extension, setup
+
+# Compile the hot-loop extension when Cython is present; compiler
+# directives (boundscheck/wraparound off) live in the .pyx header.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension('FRCstratometer._stratometer', ['_stratometer.pyx'])],
+        language_level=3)
+except ImportError:
+    ext_modules = []
+
+setup(
+    name='FRCstratometer',
+    version='0.1.0',
+    description='Simulate First Robotics Challenge games to help '
+                'determine the effectiveness of different strategies.',
+    packages=['FRCstratometer', 'FRCstratometer.reefscape'],
+    package_dir={'FRCstratometer': '.'},
+    ext_modules=ext_modules,
+    install_requires=['numpy', 'matplotlib'],
+    extras_require={'fast': ['numba']},
+    python_requires='>=3.8',
+)